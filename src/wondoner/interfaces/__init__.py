@@ -1,7 +1,7 @@
 """This module provides an interface for task aggregation and management."""
 
-from .interfaces import TaskSourceIntegration
-from .models import StandardTask
+from .interfaces import TaskSourceIntegration, TaskSourceIntegrationProto
+from .models import StandardTask, TaskChanges
 from .enums import TaskStatus
 
 __version__ = "0.1.5"  # Version of the interfaces module
@@ -9,6 +9,8 @@ __version__ = "0.1.5"  # Version of the interfaces module
 # Controls what 'from task_aggregator_interfaces import *' imports
 __all__ = [
     "TaskSourceIntegration",
+    "TaskSourceIntegrationProto",
     "StandardTask",
+    "TaskChanges",
     "TaskStatus",
 ]
@@ -3,16 +3,14 @@
 import enum
 
 
-class TaskStatus(enum.Enum):
+class TaskStatus(enum.StrEnum):
     """
     Represents the standardized status of a task within the aggregator.
     Plugins are responsible for mapping source-specific statuses to these standard ones.
 
+    Members are str instances, so str(status) returns the value and members
+    compare equal to their plain string values.
+
     """
     NOT_DONE = "not_done"
     DONE = "done"
-
-    def __str__(self):
-        """Return the value when casting to string."""
-
-        return self.value
@@ -10,13 +10,70 @@ This file is part of the Wondoner project.
 
 """
 
+import asyncio
+import contextlib
+import hmac
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, AsyncGenerator, ClassVar
+from typing import (
+    Dict, Any, Optional, AsyncGenerator, AsyncIterator, Awaitable, Callable, ClassVar, Iterable, List, Protocol,
+    Sequence,
+)
 
 # Import the models and enums from sibling files within the same package
-from .models import StandardTask
+from .models import StandardTask, TaskChanges
 from .enums import TaskStatus  # noqa: F401 - Imported for type clarity in docstrings/dicts
 
+# Marks the end of the page stream in TaskSourceIntegration._paged
+_END_OF_PAGES = object()
+
+
+class TaskSourceIntegrationProto(Protocol):
+    """Structural type matching the public interface of TaskSourceIntegration.
+
+    A static-typing contract for core application code that only consumes
+    plugins and wants to annotate them without depending on the ABC hierarchy.
+    It is deliberately not runtime-checkable: a runtime Protocol isinstance
+    check looks up every member on each call and is far slower than the cached
+    isinstance(plugin, TaskSourceIntegration) check, which remains the one to
+    use at runtime. Plugins should still inherit from TaskSourceIntegration,
+    which satisfies this Protocol. See TaskSourceIntegration for the meaning
+    of each member.
+
+    """
+    SOURCE_NAME: ClassVar[str]
+    GET_TASKS_CHUNK_SIZE: ClassVar[int]
+
+    async def get_task(self, source_task_id: str) -> Optional[StandardTask]:
+        ...
+
+    async def get_tasks(self, source_task_ids: Sequence[str]) -> List[Optional[StandardTask]]:
+        ...
+
+    async def update_task(self, source_task_id: str, changes: TaskChanges) -> StandardTask:
+        ...
+
+    def poll_changes(self, last_sync_state: Optional[Any]) -> AsyncGenerator[StandardTask, None]:
+        ...
+
+    async def fan_out(
+            self,
+            handler: Callable[[StandardTask], Awaitable[None]],
+            *,
+            workers: int = 8,
+            buffer: int = 1024,
+            last_sync_state: Optional[Any] = None,
+    ) -> None:
+        ...
+
+    def parse_webhook_payload(
+            self, payload: Dict[str, Any], headers: Dict[str, Any], raw_body: Optional[bytes] = None
+    ) -> Optional[Dict[str, Any]]:
+        ...
+
+    @staticmethod
+    def verify_hmac(secret: bytes, payload: bytes, provided_sig: str, algo: str = "sha256") -> bool:
+        ...
+
 
 class TaskSourceIntegration(ABC):
     """Abstract Base Class defining the contract for all source integrations (plugins).
@@ -31,6 +88,21 @@ class TaskSourceIntegration(ABC):
     # It's used by the core application to identify the plugin type.
     SOURCE_NAME: ClassVar[str] = "unknown"
 
+    # Number of tasks fetched concurrently per chunk by the default get_tasks.
+    # Plugins may override this to match their source API's limits.
+    GET_TASKS_CHUNK_SIZE: ClassVar[int] = 50
+
+    # Error messages for the default poll_changes/parse_webhook_payload,
+    # built once per class by __init_subclass__.
+    _POLL_ERR: ClassVar[str] = "TaskSourceIntegration does not support polling."
+    _WEBHOOK_ERR: ClassVar[str] = "TaskSourceIntegration does not support webhooks."
+
+    def __init_subclass__(cls, **kwargs: Any):
+        """Pre-computes the per-class messages raised by the default change detection methods."""
+        super().__init_subclass__(**kwargs)
+        cls._POLL_ERR = f"{cls.__name__} does not support polling."
+        cls._WEBHOOK_ERR = f"{cls.__name__} does not support webhooks."
+
     # --- Initialization ---
     @abstractmethod
     def __init__(self, config: Dict[str, Any]):
@@ -69,18 +141,46 @@ class TaskSourceIntegration(ABC):
         """
         pass
 
+    async def get_tasks(self, source_task_ids: Sequence[str]) -> List[Optional[StandardTask]]:
+        """
+        Fetches the current state of several tasks from the source system
+        using their native IDs.
+
+        The default implementation calls get_task concurrently for each ID, in
+        chunks of GET_TASKS_CHUNK_SIZE. Plugins whose source API has a batch
+        endpoint (e.g., a Jira JQL 'issuekey in (...)' search) should override
+        this to fetch each chunk in a single request.
+
+        Args:
+            source_task_ids: The unique identifiers of the tasks within the source system.
+
+        Returns:
+            A list with one entry per requested ID, in the same order. Each entry is
+            a StandardTask, or None if that task cannot be found or accessed.
+
+        """
+        tasks: List[Optional[StandardTask]] = []
+        chunk_size = self.GET_TASKS_CHUNK_SIZE
+        for start in range(0, len(source_task_ids), chunk_size):
+            chunk = source_task_ids[start:start + chunk_size]
+            tasks.extend(await asyncio.gather(*(self.get_task(task_id) for task_id in chunk)))
+        return tasks
+
     @abstractmethod
-    async def update_task(self, source_task_id: str, changes: Dict[str, Any]) -> StandardTask:
+    async def update_task(self, source_task_id: str, changes: TaskChanges) -> StandardTask:
         """
         Updates an existing task in the source system based on standardized changes.
 
         Args:
             source_task_id: The unique identifier of the task within the source system.
-            changes: A dictionary where keys are standardized field names defined in
+            changes: A TaskChanges dictionary where keys are standardized field names defined in
                      StandardTask (e.g., 'name', 'description', 'status', 'due_date')
                      and values are the new target values. For status, the value
                      should be a TaskStatus enum member. The plugin should only
                      attempt to update the fields present in this dictionary.
+                     Valid keys are listed in StandardTask.UPDATABLE_FIELDS; plugins
+                     should check `changes.keys() - StandardTask.UPDATABLE_FIELDS`
+                     up front and raise ValueError if it is not empty.
 
         Returns:
             A StandardTask object representing the full state of the task *after*
@@ -112,16 +212,127 @@ class TaskSourceIntegration(ABC):
                           to the StandardTask format.
 
         Note:
-            The plugin should handle pagination internally if the source API uses it.
+            Overrides must be async generators (``async def`` with ``yield``) so that
+            callers can consume them with ``async for``. Yield tasks one at a time
+            rather than awaiting a full list first.
+            The plugin should handle pagination internally if the source API uses it,
+            ideally via ``async for task in self._paged(fetch_next_page)`` so the next
+            page is fetched while the caller processes the current one.
             It should ideally return a new sync state marker after completion if needed,
             though this ABC doesn't mandate how that state is managed externally.
 
         """
-        # Default implementation raises NotImplementedError if called but not overridden.
-        raise NotImplementedError(f"{self.__class__.__name__} does not support polling.")
+        # Default implementation raises NotImplementedError if iterated but not overridden.
+        if False:
+            yield  # Makes this an async generator, matching the declared contract
+        raise NotImplementedError(self._POLL_ERR)
+
+    async def fan_out(
+            self,
+            handler: Callable[[StandardTask], Awaitable[None]],
+            *,
+            workers: int = 8,
+            buffer: int = 1024,
+            last_sync_state: Optional[Any] = None,
+    ) -> None:
+        """Runs poll_changes and hands each task to a pool of concurrent handlers.
+
+        Tasks yielded by poll_changes are put on a bounded asyncio.Queue that
+        'workers' consumer tasks drain, so slow downstream work does not hold up
+        polling. When the queue is full, polling waits (backpressure).
+
+        Args:
+            handler: An async callable invoked once for each polled task.
+            workers: Number of handler calls allowed to run concurrently.
+            buffer: Maximum number of polled tasks queued ahead of the workers.
+            last_sync_state: Passed through to poll_changes.
+
+        Raises:
+            ValueError: If workers or buffer is less than 1.
+            ExceptionGroup: If poll_changes or any handler call raises. Remaining
+                            work is cancelled.
+
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        if buffer < 1:
+            raise ValueError("buffer must be at least 1.")
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=buffer)
+
+        async def consume() -> None:
+            while True:
+                task = await queue.get()
+                await handler(task)
+                queue.task_done()
+
+        async with asyncio.TaskGroup() as group:
+            consumers = [group.create_task(consume()) for _ in range(workers)]
+            async for task in self.poll_changes(last_sync_state):
+                await queue.put(task)
+            await queue.join()
+            for consumer in consumers:
+                consumer.cancel()
+
+    async def _paged(
+            self,
+            fetch_page: Callable[[], Awaitable[Optional[Iterable[StandardTask]]]],
+            prefetch: int = 1,
+    ) -> AsyncIterator[StandardTask]:
+        """Yields tasks from a paginated source, prefetching pages in the background.
+
+        Helper for poll_changes implementations. A background task keeps calling
+        fetch_page while the caller consumes the tasks already yielded, so network
+        latency overlaps with downstream processing.
+
+        Args:
+            fetch_page: An async callable returning the next page of tasks each time
+                        it is awaited. Returning an empty page or None ends iteration.
+            prefetch: Maximum number of fetched pages buffered ahead of the consumer.
+
+        Yields:
+            StandardTask: Each task from each page, in order.
+
+        Raises:
+            ValueError: If prefetch is less than 1.
+            Exception: Any exception raised by fetch_page, re-raised once the pages
+                       fetched before it have been yielded.
+
+        """
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1.")
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+
+        async def fetch_pages() -> None:
+            while page := await fetch_page():
+                await queue.put(page)
+
+        def end_of_pages(_: asyncio.Task) -> None:
+            # However the fetcher finished (including a BaseException such as a leaked
+            # CancelledError), wake a consumer blocked on the empty queue. A full queue
+            # means the consumer is not blocked; it stops once the queue drains.
+            if not queue.full():
+                queue.put_nowait(_END_OF_PAGES)
+
+        fetcher = asyncio.create_task(fetch_pages())
+        fetcher.add_done_callback(end_of_pages)
+        try:
+            while not (queue.empty() and fetcher.done()):
+                if (page := await queue.get()) is _END_OF_PAGES:
+                    break
+                for task in page:
+                    yield task
+            await fetcher  # Re-raises any error from fetch_page
+        finally:
+            # Stop the fetcher if the caller exited early, and retrieve its outcome so an
+            # error raised after the caller stopped iterating is not reported as unretrieved.
+            fetcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await fetcher
 
     def parse_webhook_payload(
-            self, payload: Dict[str, Any], headers: Dict[str, Any]
+            self, payload: Dict[str, Any], headers: Dict[str, Any], raw_body: Optional[bytes] = None
     ) -> Optional[Dict[str, Any]]:
         """
         (Optional: Implement only if the source uses webhooks for change notifications)
@@ -132,6 +343,9 @@ class TaskSourceIntegration(ABC):
             headers: A dictionary of the HTTP headers from the webhook request. Useful
                      for validation like checking HMAC signatures using secrets
                      stored in self.config.
+            raw_body: The exact bytes of the webhook request body, as received. HMAC
+                      signatures should be checked against these bytes (see
+                      verify_hmac) rather than a re-serialized copy of 'payload'.
 
         Returns:
             A dictionary representing the standardized change event if the webhook is
@@ -147,4 +361,29 @@ class TaskSourceIntegration(ABC):
 
         """
         # Default implementation assumes no webhook support.
-        raise NotImplementedError(f"{self.__class__.__name__} does not support webhooks.")
+        raise NotImplementedError(self._WEBHOOK_ERR)
+
+    @staticmethod
+    def verify_hmac(secret: bytes, payload: bytes, provided_sig: str, algo: str = "sha256") -> bool:
+        """Checks a webhook HMAC signature in constant time.
+
+        Args:
+            secret: The shared webhook secret.
+            payload: The raw request body bytes exactly as received.
+            provided_sig: The hex digest sent by the source (either case), optionally
+                          prefixed with the algorithm name (e.g., GitHub's 'sha256=<hex>').
+            algo: The hashlib digest name used by the source.
+
+        Returns:
+            True if the signature matches, False otherwise.
+
+        """
+        prefix = f"{algo}="
+        if provided_sig.startswith(prefix):
+            provided_sig = provided_sig[len(prefix):]
+        expected_sig = hmac.new(secret, payload, algo).hexdigest()
+        # Compare bytes: compare_digest rejects str arguments containing non-ASCII
+        # characters, and the signature header is untrusted input.
+        return hmac.compare_digest(
+            expected_sig.encode("ascii"), provided_sig.lower().encode("utf-8", "surrogatepass")
+        )
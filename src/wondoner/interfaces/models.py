@@ -1,12 +1,14 @@
 """Models for the Wondoner interfaces module."""
 
+import json
+import sys
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, ClassVar, TypedDict
 from .enums import TaskStatus
 
 
-@dataclass(frozen=True)  # Use frozen=True if Projects are immutable once created
+@dataclass(frozen=True, slots=True)  # Use frozen=True if Projects are immutable once created
 class Project:
     """Represents a user-defined project label within the aggregator.
 
@@ -17,14 +19,57 @@ class Project:
     label: str  # The user-defined label for the project
 
 
-@dataclass
-class StandardTask:
+class TaskChanges(TypedDict, total=False):
+    """The standardized changes passed to TaskSourceIntegration.update_task.
+
+    Every key is optional; only the keys present should be updated. The keys
+    match StandardTask.UPDATABLE_FIELDS. At runtime this is a plain dict.
+
+    """
+    name: str
+    description: Optional[str]
+    due_date: Optional[date]
+    status: TaskStatus
+    url: Optional[str]
+
+
+def _intern(value: Any) -> Any:
+    """Interns exact str values; sys.intern rejects str subclasses and other types."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Bound once so StandardTask._unvalidated avoids the attribute lookup per task
+_new_object = object.__new__
+
+
+class _RawCacheSlot:
+    """Provides StandardTask's private slot for caching the parsed raw_data.
+
+    dataclass(slots=True) only creates slots for fields, so the cache slot is
+    inherited from here to keep it out of fields(), asdict() and __init__.
+
+    """
+    __slots__ = ("_raw_cache",)
+
+
+@dataclass(slots=True, eq=False)  # Use slots=True to drop the per-instance __dict__; eq/hash by id below
+class StandardTask(_RawCacheSlot):
     """Represents a task in a standardized format within the aggregator.
 
     Plugins are responsible for mapping data between the source system's
     format and this standard structure.
 
+    Equality and hashing use only the aggregator-assigned id, so tasks can be
+    deduplicated cheaply in sets and dicts.
+
+    Instances use __slots__ rather than a per-instance __dict__, keeping the
+    memory footprint small when many tasks are materialized during a poll.
+
     """
+    # --- Class Attribute ---
+    # Standardized field names that TaskSourceIntegration.update_task may change
+    UPDATABLE_FIELDS: ClassVar[frozenset[str]] = frozenset({"name", "description", "due_date", "status", "url"})
+
     # --- Aggregator Metadata ---
     # Unique ID assigned by the aggregator for this specific task representation
     id: str
@@ -49,16 +94,89 @@ class StandardTask:
     updated_at: Optional[datetime] = None
 
     # --- Raw Data (Optional) ---
-    # Optionally store the original data structure from the source system
+    # Optionally store the original JSON bytes from the source system
     # for debugging or advanced features. Use field to avoid it being in repr.
-    raw_data: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    # Kept unparsed so the cost of decoding is only paid if `raw` is accessed.
+    raw_data: Optional[bytes] = field(default=None, repr=False)
 
     # Optional direct URL to the task in the source system
     url: Optional[str] = None
 
     def __post_init__(self):
-        """Basic validation example (can add more if needed)"""
+        """Basic validation example (can add more if needed), plus source_name interning"""
         if not isinstance(self.status, TaskStatus):
             raise ValueError(f"status must be a TaskStatus enum member, not {type(self.status)}")
         if not self.name:
             raise ValueError("Task name cannot be empty.")
+        # Every task from a plugin shares the same source_name; intern it so they
+        # all reference one string object instead of one copy per task.
+        self.source_name = _intern(self.source_name)
+
+    def __eq__(self, other: object) -> bool:
+        """Tasks are equal when their aggregator ids are equal."""
+        if not isinstance(other, StandardTask):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        """Hash by aggregator id, consistent with __eq__."""
+        return hash(self.id)
+
+    @property
+    def raw(self) -> Optional[Dict[str, Any]]:
+        """The raw_data JSON parsed into a dictionary, or None if there is none.
+
+        Parsed on first access and cached. The cache remembers which raw_data
+        object it was parsed from, so assigning new raw_data invalidates it.
+
+        """
+        raw_data = self.raw_data
+        if raw_data is None:
+            return None
+        cache = getattr(self, "_raw_cache", None)
+        if cache is None or cache[0] is not raw_data:
+            cache = self._raw_cache = (raw_data, json.loads(raw_data))
+        return cache[1]
+
+    @staticmethod
+    def _unvalidated(
+            id: str,
+            project_id: str,
+            source_id: str,
+            source_name: str,
+            name: str,
+            description: Optional[str] = None,
+            due_date: Optional[date] = None,
+            status: TaskStatus = TaskStatus.NOT_DONE,
+            created_at: Optional[datetime] = None,
+            updated_at: Optional[datetime] = None,
+            raw_data: Optional[bytes] = None,
+            url: Optional[str] = None,
+    ) -> "StandardTask":
+        """Builds a task without running __post_init__ validation.
+
+        Intended for plugin mapping code on bulk sync paths where the values are
+        already known to be valid (status is a TaskStatus member, name is not
+        empty, source_name is an exact str). Omitted optional fields take their
+        usual defaults. The parameters mirror the dataclass fields and are
+        assigned directly, so this is cheaper than the validating constructor.
+
+        Raises:
+            TypeError: If a required field is missing, an unknown field is given,
+                       or source_name is not an exact str (it is interned).
+
+        """
+        task = _new_object(StandardTask)
+        task.id = id
+        task.project_id = project_id
+        task.source_id = source_id
+        task.source_name = sys.intern(source_name)
+        task.name = name
+        task.description = description
+        task.due_date = due_date
+        task.status = status
+        task.created_at = created_at
+        task.updated_at = updated_at
+        task.raw_data = raw_data
+        task.url = url
+        return task
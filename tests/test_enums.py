@@ -17,3 +17,11 @@ def test_task_status_enum_str():
 
     assert str(TaskStatus.NOT_DONE) == "not_done"
     assert str(TaskStatus.DONE) == "done"
+
+
+def test_task_status_enum_is_str():
+    """Verify TaskStatus members are strings that compare equal to their values."""
+
+    assert isinstance(TaskStatus.DONE, str)
+    assert TaskStatus.DONE == "done"
+    assert TaskStatus("not_done") is TaskStatus.NOT_DONE
@@ -2,8 +2,13 @@
 
 import pytest
 import abc
+import asyncio
+import contextlib
+import gc
+import hmac
+import inspect
 from typing import Dict, Any, Optional
-from wondoner.interfaces import TaskSourceIntegration  # Use __init__.py export
+from wondoner.interfaces import TaskSourceIntegration, TaskSourceIntegrationProto  # Use __init__.py export
 from wondoner.interfaces.models import StandardTask
 
 
@@ -52,16 +57,271 @@ class MinimalPlugin(TaskSourceIntegration):
     # We inherit the default implementations of poll_changes and parse_webhook_payload
 
 
+def test_protocol_covers_public_interface():
+    """Test that TaskSourceIntegrationProto declares every public ABC member and is static-only."""
+    public_members = {name for name in vars(TaskSourceIntegration) if not name.startswith("_")}
+    protocol_members = set(vars(TaskSourceIntegrationProto)) | set(TaskSourceIntegrationProto.__annotations__)
+    assert public_members <= protocol_members
+
+    # Not runtime-checkable: runtime checks should use the (cached) ABC isinstance
+    with pytest.raises(TypeError):
+        isinstance(MinimalPlugin(config={}), TaskSourceIntegrationProto)
+
+
 @pytest.mark.asyncio
 async def test_default_poll_changes_raises_not_implemented():
-    """Test that awaiting the default poll_changes raises NotImplementedError."""
+    """Test that iterating the default poll_changes raises NotImplementedError."""
     plugin = MinimalPlugin(config={})
 
     expected_error_pattern = f"{MinimalPlugin.__name__} does not support polling"
     # expected_error_pattern = rf"{MinimalPlugin.__name__} does not support polling\."
 
     with pytest.raises(NotImplementedError, match=expected_error_pattern):
-        await plugin.poll_changes(last_sync_state=None)
+        async for _ in plugin.poll_changes(last_sync_state=None):
+            pass
+
+
+def test_default_poll_changes_is_async_generator():
+    """Test that the default poll_changes is an async generator, not a coroutine."""
+    plugin = MinimalPlugin(config={})
+    assert inspect.isasyncgenfunction(MinimalPlugin.poll_changes)
+    assert inspect.isasyncgen(plugin.poll_changes(last_sync_state=None))
+
+
+def _make_task(index: int) -> StandardTask:
+    """Build a simple StandardTask for paging tests."""
+    return StandardTask(id=f"t{index}", project_id="p1", source_id=f"SRC-{index}",
+                        source_name="minimal_test", name=f"Task {index}")
+
+
+@pytest.mark.asyncio
+async def test_paged_yields_all_tasks_in_order():
+    """Test that _paged yields every task from every page, in order."""
+    plugin = MinimalPlugin(config={})
+    pages = [[_make_task(0), _make_task(1)], [_make_task(2)], []]
+
+    async def fetch_page():
+        return pages.pop(0)
+
+    ids = [task.id async for task in plugin._paged(fetch_page, prefetch=2)]
+    assert ids == ["t0", "t1", "t2"]
+
+
+@pytest.mark.asyncio
+async def test_paged_propagates_fetch_errors():
+    """Test that _paged yields fetched tasks, then re-raises the fetch_page error."""
+    plugin = MinimalPlugin(config={})
+    calls = 0
+
+    async def fetch_page():
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            raise RuntimeError("API unavailable")
+        return [_make_task(0)]
+
+    seen = []
+    with pytest.raises(RuntimeError, match="API unavailable"):
+        async for task in plugin._paged(fetch_page):
+            seen.append(task.id)
+    assert seen == ["t0"]
+
+
+@pytest.mark.asyncio
+async def test_paged_propagates_fetch_cancellation():
+    """Test that a CancelledError leaking from fetch_page ends _paged instead of hanging it."""
+    plugin = MinimalPlugin(config={})
+    calls = 0
+
+    async def fetch_page():
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            raise asyncio.CancelledError()
+        return [_make_task(0)]
+
+    async def consume():
+        return [task.id async for task in plugin._paged(fetch_page)]
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(consume(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_paged_full_buffer_then_fetch_error():
+    """Test that _paged drains a full buffer, then re-raises an error from the final fetch."""
+    plugin = MinimalPlugin(config={})
+    calls = 0
+
+    async def fetch_page():
+        nonlocal calls
+        calls += 1
+        if calls > 3:
+            raise RuntimeError("API unavailable")
+        return [_make_task(calls)]
+
+    seen = []
+    with pytest.raises(RuntimeError, match="API unavailable"):
+        async for task in plugin._paged(fetch_page, prefetch=2):
+            if not seen:
+                for _ in range(5):
+                    await asyncio.sleep(0)  # Let the fetcher fill the buffer and then fail
+            seen.append(task.id)
+    assert seen == ["t1", "t2", "t3"]
+
+
+@pytest.mark.asyncio
+async def test_paged_early_exit_retrieves_fetch_errors():
+    """Test that closing _paged early leaves no unretrieved fetcher exception behind."""
+    plugin = MinimalPlugin(config={})
+    loop = asyncio.get_running_loop()
+    reported = []
+    previous_handler = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _, context: reported.append(context))
+    calls = 0
+
+    async def fetch_page():
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            raise RuntimeError("API unavailable")
+        return [_make_task(0), _make_task(1)]
+
+    try:
+        async with contextlib.aclosing(plugin._paged(fetch_page)) as tasks:
+            async for _ in tasks:
+                for _ in range(3):
+                    await asyncio.sleep(0)  # Let the fetcher fail before the caller stops
+                break
+        assert calls == 2
+        gc.collect()
+        assert reported == []
+    finally:
+        loop.set_exception_handler(previous_handler)
+
+
+@pytest.mark.asyncio
+async def test_paged_rejects_invalid_prefetch():
+    """Test that _paged requires a prefetch of at least one page."""
+    plugin = MinimalPlugin(config={})
+
+    async def fetch_page():
+        return None
+
+    with pytest.raises(ValueError, match="prefetch must be at least 1"):
+        async for _ in plugin._paged(fetch_page, prefetch=0):
+            pass
+
+
+class PollingPlugin(MinimalPlugin):
+    """Plugin whose poll_changes yields a fixed number of tasks."""
+
+    TASK_COUNT = 20
+
+    async def poll_changes(self, last_sync_state: Optional[Any]):
+        for index in range(self.TASK_COUNT):
+            yield _make_task(index)
+
+
+@pytest.mark.asyncio
+async def test_fan_out_handles_every_task_concurrently():
+    """Test that fan_out calls the handler for every task, using several workers at once."""
+    plugin = PollingPlugin(config={})
+    handled = []
+    active = 0
+    peak = 0
+
+    async def handler(task: StandardTask) -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        handled.append(task.id)
+        active -= 1
+
+    await plugin.fan_out(handler, workers=4, buffer=2)
+
+    assert sorted(handled) == sorted(f"t{index}" for index in range(PollingPlugin.TASK_COUNT))
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_fan_out_propagates_handler_errors():
+    """Test that a failing handler stops fan_out and surfaces its exception."""
+    plugin = PollingPlugin(config={})
+
+    async def handler(task: StandardTask) -> None:
+        if task.id == "t3":
+            raise RuntimeError("handler failed")
+
+    with pytest.raises(ExceptionGroup) as excinfo:
+        await plugin.fan_out(handler, workers=2, buffer=1)
+    assert [str(exc) for exc in excinfo.value.exceptions] == ["handler failed"]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_rejects_invalid_sizes():
+    """Test that fan_out requires at least one worker and a non-empty buffer."""
+    plugin = PollingPlugin(config={})
+
+    async def handler(task: StandardTask) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        await plugin.fan_out(handler, workers=0)
+    with pytest.raises(ValueError, match="buffer must be at least 1"):
+        await plugin.fan_out(handler, buffer=0)
+
+
+class FetchingPlugin(MinimalPlugin):
+    """Plugin whose get_task records calls, for testing the default get_tasks."""
+
+    GET_TASKS_CHUNK_SIZE = 2
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.fetched = []
+        self.active = 0
+        self.peak = 0
+
+    async def get_task(self, source_task_id: str) -> Optional[StandardTask]:
+        self.fetched.append(source_task_id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.001)
+        self.active -= 1
+        if source_task_id == "missing":
+            return None
+        return StandardTask(id=f"agg-{source_task_id}", project_id="p1", source_id=source_task_id,
+                            source_name=self.SOURCE_NAME, name=f"Task {source_task_id}")
+
+
+@pytest.mark.asyncio
+async def test_default_get_tasks_fetches_each_id_in_order():
+    """Test that the default get_tasks returns one result per ID, preserving order."""
+    plugin = FetchingPlugin(config={})
+    tasks = await plugin.get_tasks(["A-1", "missing", "A-3", "A-4", "A-5"])
+
+    assert [task.source_id if task else None for task in tasks] == ["A-1", None, "A-3", "A-4", "A-5"]
+    assert plugin.fetched == ["A-1", "missing", "A-3", "A-4", "A-5"]
+
+
+@pytest.mark.asyncio
+async def test_default_get_tasks_fetches_in_concurrent_chunks():
+    """Test that the default get_tasks runs at most GET_TASKS_CHUNK_SIZE get_task calls at once."""
+    plugin = FetchingPlugin(config={})
+    await plugin.get_tasks(["A-1", "A-2", "A-3", "A-4", "A-5"])
+
+    # One unchunked gather would reach 5; fetching one at a time would stay at 1
+    assert plugin.peak == FetchingPlugin.GET_TASKS_CHUNK_SIZE == 2
+
+
+@pytest.mark.asyncio
+async def test_default_get_tasks_empty():
+    """Test that the default get_tasks handles an empty ID list."""
+    plugin = FetchingPlugin(config={})
+    assert await plugin.get_tasks([]) == []
+    assert plugin.fetched == []
 
 
 def test_default_parse_webhook_payload_raises_not_implemented():
@@ -70,3 +330,38 @@ def test_default_parse_webhook_payload_raises_not_implemented():
     expected_error_msg = f"{MinimalPlugin.__name__} does not support webhooks"
     with pytest.raises(NotImplementedError, match=expected_error_msg):
         plugin.parse_webhook_payload(payload={}, headers={})
+
+
+def test_verify_hmac():
+    """Test verify_hmac accepts matching signatures and rejects others."""
+    secret = b"webhook-secret"
+    body = b'{"issue": {"key": "JIRA-123"}}'
+    signature = hmac.new(secret, body, "sha256").hexdigest()
+
+    assert TaskSourceIntegration.verify_hmac(secret, body, signature)
+    assert TaskSourceIntegration.verify_hmac(secret, body, f"sha256={signature}")
+    assert not TaskSourceIntegration.verify_hmac(secret, body + b" ", signature)
+    assert not TaskSourceIntegration.verify_hmac(b"wrong-secret", body, signature)
+    assert not TaskSourceIntegration.verify_hmac(secret, body, signature, algo="sha1")
+
+
+def test_verify_hmac_accepts_uppercase_hex():
+    """Test verify_hmac accepts a valid digest sent in uppercase hex."""
+    secret = b"webhook-secret"
+    body = b'{"issue": {"key": "JIRA-123"}}'
+    signature = hmac.new(secret, body, "sha256").hexdigest().upper()
+
+    assert TaskSourceIntegration.verify_hmac(secret, body, signature)
+    assert TaskSourceIntegration.verify_hmac(secret, body, f"sha256={signature}")
+
+
+def test_verify_hmac_rejects_non_ascii_signature():
+    """Test verify_hmac returns False, rather than raising, for non-ASCII signatures."""
+    assert not TaskSourceIntegration.verify_hmac(b"s", b"x", "\u00e9" * 64)
+    assert not TaskSourceIntegration.verify_hmac(b"s", b"x", "\ud800" * 64)
+
+
+def test_subclass_error_messages_use_subclass_name():
+    """Test that each subclass gets its own pre-computed default error messages."""
+    assert MinimalPlugin._POLL_ERR == "MinimalPlugin does not support polling."
+    assert FetchingPlugin._WEBHOOK_ERR == "FetchingPlugin does not support webhooks."
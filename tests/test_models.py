@@ -1,11 +1,15 @@
 """Unit tests for the models in the wondoner.interfaces.models module."""
 
+import inspect
 import pytest
-from dataclasses import FrozenInstanceError, is_dataclass
+import sys
+import timeit
+from dataclasses import MISSING, FrozenInstanceError, asdict, astuple, fields, is_dataclass
 from datetime import date, datetime
 from uuid import uuid4  # Using UUID for example IDs
+from wondoner.interfaces import models
 from wondoner.interfaces.enums import TaskStatus
-from wondoner.interfaces.models import Project, StandardTask
+from wondoner.interfaces.models import Project, StandardTask, TaskChanges
 
 
 def test_project_creation_and_attributes():
@@ -61,6 +65,7 @@ def test_standard_task_creation_minimal():
     assert task.created_at is None
     assert task.updated_at is None
     assert task.raw_data is None
+    assert task.raw is None
 
 
 def test_standard_task_creation_full():
@@ -68,7 +73,7 @@ def test_standard_task_creation_full():
 
     now = datetime.now()
     today = date.today()
-    raw = {"key": "value"}
+    raw = b'{"key": "value"}'
     task = StandardTask(
         id=str(uuid4()),
         project_id=str(uuid4()),
@@ -90,6 +95,20 @@ def test_standard_task_creation_full():
     assert task.created_at == now
     assert task.updated_at == now
     assert task.raw_data == raw
+    assert task.raw == {"key": "value"}
+    assert task.raw is task.raw  # Parsed once, then cached
+
+
+def test_models_use_slots():
+    """Test that Project and StandardTask use __slots__ instead of a per-instance __dict__."""
+
+    project = Project(id=str(uuid4()), label="Slotted Project")
+    task = StandardTask(id="t1", project_id="p1", source_id="s1", source_name="src", name="Slotted Task")
+
+    assert not hasattr(project, "__dict__")
+    assert not hasattr(task, "__dict__")
+    with pytest.raises(AttributeError):
+        task.not_a_field = "value"
 
 
 # noinspection PyTypeChecker
@@ -106,6 +125,160 @@ def test_standard_task_post_init_validation():
         StandardTask(id="t2", project_id="p1", source_id="s2", source_name="src", name="")
 
 
+def test_standard_task_equality_and_hash_use_id():
+    """Test that StandardTask equality and hashing depend only on the id field."""
+
+    task = StandardTask(id="t1", project_id="p1", source_id="s1", source_name="src", name="Original")
+    same_id = StandardTask(id="t1", project_id="p2", source_id="s1", source_name="src", name="Renamed",
+                           status=TaskStatus.DONE)
+    other_id = StandardTask(id="t2", project_id="p1", source_id="s1", source_name="src", name="Original")
+
+    assert task == same_id
+    assert hash(task) == hash(same_id)
+    assert task != other_id
+    assert task != "t1"
+    assert len({task, same_id, other_id}) == 2
+
+
+def test_standard_task_raw_cache(monkeypatch):
+    """Test that raw is re-parsed after raw_data changes and that the cache is not a field."""
+
+    task = StandardTask(id="t1", project_id="p1", source_id="s1", source_name="src", name="Task",
+                        raw_data=b'{"a": 1}')
+    assert task.raw == {"a": 1}
+
+    task.raw_data = b'{"a": 2}'
+    assert task.raw == {"a": 2}
+    task.raw_data = b"null"
+    parses = []
+    monkeypatch.setattr(models.json, "loads", lambda data: parses.append(data))
+    assert task.raw is None
+    assert task.raw is None
+    assert parses == [b"null"]  # A parsed JSON null is cached too
+    task.raw_data = None
+    assert task.raw is None
+
+    assert "_raw_cache" not in {f.name for f in fields(StandardTask)}
+    assert "_raw_cache" not in asdict(task)
+    with pytest.raises(TypeError, match="unexpected keyword argument '_raw_cache'"):
+        StandardTask._unvalidated(id="t1", project_id="p1", source_id="s1", source_name="src", name="Task",
+                                  _raw_cache=None)
+
+
+def test_standard_task_interns_source_name():
+    """Test that tasks built with equal source_name strings share one interned object."""
+
+    names = ["".join(["ji", "ra"]) for _ in range(2)]
+    assert names[0] is not names[1]
+    tasks = [StandardTask(id=f"t{i}", project_id="p1", source_id=f"JIRA-{i}", source_name=name, name="Task")
+             for i, name in enumerate(names)]
+
+    assert tasks[0].source_name is tasks[1].source_name
+
+
+def test_standard_task_unvalidated_interns_source_name():
+    """Test that _unvalidated interns source_name like the validating constructor."""
+
+    source_name = "".join(["ji", "ra"])
+    task = StandardTask._unvalidated(id="t1", project_id="p1", source_id="JIRA-1", source_name=source_name,
+                                     name="Task")
+
+    assert task.source_name is sys.intern(source_name)
+
+
+def test_standard_task_source_name_non_exact_str_not_interned():
+    """Test that the constructor keeps str subclass source_name values as given."""
+
+    class SourceName(str):
+        pass
+
+    subclass_name = SourceName("jira")
+    task = StandardTask(id="t1", project_id="p1", source_id="JIRA-1", source_name=subclass_name, name="Task")
+    assert task.source_name is subclass_name
+    # _unvalidated trusts its caller and requires an exact str
+    with pytest.raises(TypeError):
+        StandardTask._unvalidated(id="t1", project_id="p1", source_id="JIRA-1", source_name=subclass_name,
+                                  name="Task")
+
+
+def test_standard_task_unvalidated():
+    """Test that _unvalidated builds an equivalent task with defaults, skipping validation."""
+
+    kwargs = dict(id="t1", project_id="p1", source_id="s1", source_name="src", name="Fast Task")
+    task = StandardTask._unvalidated(**kwargs, status=TaskStatus.DONE)
+
+    # Equality is by id only, so compare every field value explicitly
+    assert astuple(task) == astuple(StandardTask(**kwargs, status=TaskStatus.DONE))
+    assert task.status == TaskStatus.DONE
+    assert task.description is None
+    assert task.raw_data is None
+    # No validation is run, so an empty name is accepted
+    assert StandardTask._unvalidated(**{**kwargs, "name": ""}).name == ""
+
+    with pytest.raises(TypeError, match="missing 1 required positional argument: 'name'"):
+        StandardTask._unvalidated(id="t1", project_id="p1", source_id="s1", source_name="src")
+    with pytest.raises(TypeError, match="unexpected keyword argument 'bogus'"):
+        StandardTask._unvalidated(**kwargs, bogus=1)
+
+
+def test_standard_task_unvalidated_matches_fields():
+    """Test that _unvalidated's parameters and defaults mirror the StandardTask fields."""
+
+    parameters = inspect.signature(StandardTask._unvalidated).parameters
+    task_fields = [f for f in fields(StandardTask)]
+
+    assert list(parameters) == [f.name for f in task_fields]
+    for task_field in task_fields:
+        # A default_factory field cannot be mirrored by a plain parameter default
+        assert task_field.default_factory is MISSING
+        expected = inspect.Parameter.empty if task_field.default is MISSING else task_field.default
+        assert parameters[task_field.name].default == expected
+
+
+def test_standard_task_unvalidated_skips_post_init(monkeypatch):
+    """Test that _unvalidated never runs __post_init__."""
+
+    def fail(_):
+        raise AssertionError("__post_init__ should not run")
+
+    monkeypatch.setattr(StandardTask, "__post_init__", fail)
+    assert StandardTask._unvalidated(id="t1", project_id="p1", source_id="s1", source_name="src",
+                                     name="Task").name == "Task"
+
+
+def test_standard_task_unvalidated_is_cheaper_than_constructor():
+    """Test that _unvalidated builds tasks faster than the validating constructor."""
+
+    kwargs = dict(id="t1", project_id="p1", source_id="s1", source_name="src", name="Task")
+    validated = []
+    unvalidated = []
+    # Interleave the runs so background noise affects both sides alike; compare the best of each
+    for _ in range(15):
+        validated.append(timeit.timeit(lambda: StandardTask(**kwargs), number=20000))
+        unvalidated.append(timeit.timeit(lambda: StandardTask._unvalidated(**kwargs), number=20000))
+
+    assert min(unvalidated) < min(validated)
+
+
+def test_standard_task_updatable_fields():
+    """Test that UPDATABLE_FIELDS is a class-level frozenset of real StandardTask fields."""
+
+    field_names = {f.name for f in fields(StandardTask)}
+    assert isinstance(StandardTask.UPDATABLE_FIELDS, frozenset)
+    assert StandardTask.UPDATABLE_FIELDS == {"name", "description", "due_date", "status", "url"}
+    assert StandardTask.UPDATABLE_FIELDS <= field_names
+    assert "UPDATABLE_FIELDS" not in field_names
+
+
+def test_task_changes_matches_updatable_fields():
+    """Test that TaskChanges declares exactly the updatable StandardTask fields, all optional."""
+
+    assert set(TaskChanges.__annotations__) == StandardTask.UPDATABLE_FIELDS
+    assert TaskChanges.__required_keys__ == frozenset()
+    changes: TaskChanges = {"status": TaskStatus.DONE}
+    assert changes.keys() - StandardTask.UPDATABLE_FIELDS == set()
+
+
 def test_standard_task_repr_excludes_raw_data():
     """Test that raw_data is not included in the default repr."""
 
@@ -115,7 +288,7 @@ def test_standard_task_repr_excludes_raw_data():
         source_id="SRC-789",
         source_name="test_source_3",
         name="Repr Test",
-        raw_data={"lots": "of", "uninteresting": "data"},
+        raw_data=b'{"lots": "of", "uninteresting": "data"}',
     )
     assert "raw_data=" not in repr(task)
     # Check that other fields ARE in repr